@@ -470,7 +470,7 @@ class ApiImplType1(ApiImpl):
                     tzinfo=self.data_timezone,
                 )
 
-            vehicle.location = (
+            vehicle.set_location(
                 get_child_value(state, "Location.GeoCoord.Latitude"),
                 get_child_value(state, "Location.GeoCoord.Longitude"),
                 location_last_updated_at,
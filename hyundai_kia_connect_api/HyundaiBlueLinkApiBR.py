@@ -393,7 +393,7 @@ class HyundaiBlueLinkApiBR(ApiImpl):
         # Map API response field names to TripInfo field names
         return TripInfo(
             trip_day_list=trip_day_list,
-            trip_period_type=TripPeriodType(data["tripPeriodType"]),
+            trip_period_type=data["tripPeriodType"],
             month_trip_day_cnt=data["monthTripDayCnt"],
             # Map API field names to TripInfo field names
             drive_time=data["tripDrvTime"],
@@ -404,10 +404,11 @@ class HyundaiBlueLinkApiBR(ApiImpl):
         )
 
     def update_vehicle_with_cached_state(self, token: Token, vehicle: Vehicle) -> None:
-        state = CachedVehicleState()
-        state.details = self._get_vehicle_details(token, vehicle)
-        state.current_state = self._request_vehicle_state(token, vehicle, False)
-        state.location = self._get_vehicle_location(token, vehicle)
+        state = CachedVehicleState(
+            details=self._get_vehicle_details(token, vehicle),
+            current_state=self._request_vehicle_state(token, vehicle, False),
+            location=self._get_vehicle_location(token, vehicle),
+        )
         self._update_vehicle_properties(vehicle, state)
         self._update_vehicle_location(vehicle, state.location)
 
@@ -433,7 +434,7 @@ class HyundaiBlueLinkApiBR(ApiImpl):
             return None
 
     def _update_vehicle_location(self, vehicle: Vehicle, location: VehicleLocation):
-        vehicle.location = (location.lat, location.long, location.time)
+        vehicle.set_location(location.lat, location.long, location.time)
 
     def force_refresh_vehicle_state(self, token: Token, vehicle: Vehicle) -> None:
         """
@@ -445,7 +445,7 @@ class HyundaiBlueLinkApiUSA(ApiImpl):
         vehicle.fuel_level = get_child_value(state, "vehicleStatus.fuelLevel")
 
         if get_child_value(state, "vehicleStatus.vehicleLocation.coord.lat"):
-            vehicle.location = (
+            vehicle.set_location(
                 get_child_value(state, "vehicleStatus.vehicleLocation.coord.lat"),
                 get_child_value(state, "vehicleStatus.vehicleLocation.coord.lon"),
                 parse_datetime(
@@ -436,7 +436,7 @@ class KiaUvoApiCA(ApiImpl):
     ) -> None:
         if get_child_value(state, "coord.lat"):
             self.vehicle_timezone = vehicle.timezone
-            vehicle.location = (
+            vehicle.set_location(
                 get_child_value(state, "coord.lat"),
                 get_child_value(state, "coord.lon"),
                 parse_datetime(get_child_value(state, "time"), self.data_timezone),
@@ -625,7 +625,7 @@ class KiaUvoApiCN(ApiImplType1):
         )
 
         if get_child_value(state, "vehicleLocation.coord.lat"):
-            vehicle.location = (
+            vehicle.set_location(
                 get_child_value(state, "vehicleLocation.coord.lat"),
                 get_child_value(state, "vehicleLocation.coord.lon"),
                 parse_datetime(
@@ -229,7 +229,7 @@ class KiaUvoApiIN(ApiImplType1):
 
     def _update_vehicle_location(self, vehicle: Vehicle, state: dict) -> None:
         if get_child_value(state, "coord.lat"):
-            vehicle.location = (
+            vehicle.set_location(
                 get_child_value(state, "coord.lat"),
                 get_child_value(state, "coord.lon"),
                 self.get_last_updated_at(get_child_value(state, "time")),
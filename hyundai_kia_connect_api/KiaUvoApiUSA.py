@@ -538,7 +538,7 @@ class KiaUvoApiUSA(ApiImpl):
         )
 
         if get_child_value(state, "lastVehicleInfo.location.coord.lat"):
-            vehicle.location = (
+            vehicle.set_location(
                 get_child_value(state, "lastVehicleInfo.location.coord.lat"),
                 get_child_value(state, "lastVehicleInfo.location.coord.lon"),
                 parse_datetime(
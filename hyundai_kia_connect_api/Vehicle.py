@@ -1,19 +1,29 @@
 # pylint:disable=missing-class-docstring,missing-function-docstring,wildcard-import,unused-wildcard-import,invalid-name,logging-fstring-interpolation
 """Vehicle class"""
 
+from __future__ import annotations
+
 import logging
 import datetime
-import typing
 from dataclasses import dataclass, field
 from enum import IntEnum
+from operator import attrgetter
 
 from .utils import get_float, get_safe_local_datetime
 from .const import DISTANCE_UNITS
 
 _LOGGER = logging.getLogger(__name__)
 
+# sort keys for the daily stats and trip info lists.
+# datetimes and the fixed-width yyyymmdd / hhmmss strings compare in C:
+# precomputed numeric keys (timestamp(), int(yyyymmdd)) or numpy argsort
+# cost more to extract than they save, even for multi-year histories
+_DATE_KEY = attrgetter("date")
+_YYYYMMDD_KEY = attrgetter("yyyymmdd")
+_HHMMSS_KEY = attrgetter("hhmmss")
+
 
-@dataclass
+@dataclass(slots=True)
 class TripInfo:
     """Trip Info"""
 
@@ -26,12 +36,12 @@ class TripInfo:
     max_speed: int = None
 
     # API response fields (only used in API implementations)
-    trip_day_list: list["TripDayListItem"] = None
-    trip_period_type: "TripPeriodType" = None
+    trip_day_list: list[TripDayListItem] = None
+    trip_period_type: int = None  # TripPeriodType value, kept as plain int
     month_trip_day_cnt: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DayTripCounts:
     """Day trip counts"""
 
@@ -39,7 +49,7 @@ class DayTripCounts:
     trip_count: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MonthTripInfo:
     """Month Trip Info"""
 
@@ -48,7 +58,7 @@ class MonthTripInfo:
     day_list: list[DayTripCounts] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DayTripInfo:
     """Day Trip Info"""
 
@@ -57,7 +67,7 @@ class DayTripInfo:
     trip_list: list[TripInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyDrivingStats:
     # energy stats are expressed in watthours (Wh)
     date: datetime.datetime = None
@@ -68,19 +78,20 @@ class DailyDrivingStats:
     battery_care_consumption: int = None
     regenerated_energy: int = None
     distance: float = None
-    distance_unit: str = DISTANCE_UNITS[1]  # set to kms by default
+    # always one of the shared DISTANCE_UNITS strings, set to kms by default
+    distance_unit: str = DISTANCE_UNITS[1]
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class CachedVehicleState:
     """Cache of vehicle state information"""
 
-    location: "VehicleLocation | None" = None
+    location: VehicleLocation | None = None
     details: dict = field(default_factory=dict)
     current_state: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleLocation:
     """Vehicle location information"""
 
@@ -96,7 +107,7 @@ class TripPeriodType(IntEnum):
     DAY = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TripDayListItem:
     """Trip day list item for API responses"""
 
@@ -104,7 +115,33 @@ class TripDayListItem:
     count: int
 
 
-@dataclass
+class _ValueUnit:
+    """Descriptor for a (value, unit) tuple, stored in _<name> and _<name>_unit"""
+
+    __slots__ = ("_convert", "_private", "_unit")
+
+    def __init__(self, convert=None):
+        self._convert = convert
+
+    def __set_name__(self, owner, name):
+        self._private = f"_{name}"
+        self._unit = f"_{name}_unit"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance, self._private)
+
+    def __set__(self, instance, value):
+        setattr(instance, self._unit, value[1])
+        setattr(
+            instance,
+            self._private,
+            value[0] if self._convert is None else self._convert(value[0]),
+        )
+
+
+@dataclass(eq=False, slots=True)
 class Vehicle:
     id: str = None
     name: str = None
@@ -123,11 +160,9 @@ class Vehicle:
     # Shared (EV/PHEV/HEV/IC)
     # General
     _total_driving_range: float = None
-    _total_driving_range_value: float = None
     _total_driving_range_unit: str = None
 
     _odometer: float = None
-    _odometer_value: float = None
     _odometer_unit: str = None
 
     _geocode_address: str = None
@@ -139,8 +174,8 @@ class Vehicle:
     _last_updated_at: datetime.datetime = None
     timezone: datetime.timezone = datetime.timezone.utc  # default UTC
 
-    dtc_count: typing.Union[int, None] = None
-    dtc_descriptions: typing.Union[dict, None] = None
+    dtc_count: int | None = None
+    dtc_descriptions: dict | None = None
 
     smart_key_battery_warning_is_on: bool = None
     washer_fluid_warning_is_on: bool = None
@@ -160,6 +195,11 @@ class Vehicle:
     front_right_seat_status: str = None
     rear_left_seat_status: str = None
     rear_right_seat_status: str = None
+    # Kia USA: raw seat heat state
+    front_left_seat_heater_is_on: int = None
+    front_right_seat_heater_is_on: int = None
+    rear_left_seat_heater_is_on: int = None
+    rear_right_seat_heater_is_on: int = None
 
     # Door Status
     is_locked: bool = None
@@ -190,10 +230,8 @@ class Vehicle:
 
     # Service Data
     _next_service_distance: float = None
-    _next_service_distance_value: float = None
     _next_service_distance_unit: str = None
     _last_service_distance: float = None
-    _last_service_distance_value: float = None
     _last_service_distance_unit: str = None
 
     # Location
@@ -203,15 +241,15 @@ class Vehicle:
 
     # EV fields (EV/PHEV)
 
-    ev_charge_port_door_is_open: typing.Union[bool, None] = None
-    ev_charging_power: typing.Union[float, None] = None  # Charging power in kW
+    ev_charge_port_door_is_open: bool | None = None
+    ev_charging_power: float | None = None  # Charging power in kW
 
-    ev_charge_limits_dc: typing.Union[int, None] = None
-    ev_charge_limits_ac: typing.Union[int, None] = None
-    ev_charging_current: typing.Union[int, None] = (
+    ev_charge_limits_dc: int | None = None
+    ev_charge_limits_ac: int | None = None
+    ev_charging_current: int | None = (
         None  # Europe feature only, ac charging current limit
     )
-    ev_v2l_discharge_limit: typing.Union[int, None] = None
+    ev_v2l_discharge_limit: int | None = None
 
     # energy consumed and regenerated since the vehicle was paired with the account
     # (so not necessarily for the vehicle's lifetime)
@@ -224,59 +262,61 @@ class Vehicle:
 
     # feature only available for some regions (getter/setter for sorting)
     _daily_stats: list[DailyDrivingStats] = field(default_factory=list)
+    # sorting is deferred until the list is read
+    _daily_stats_sorted: bool = field(default=False, init=False, repr=False)
 
     @property
     def daily_stats(self):
+        if not self._daily_stats_sorted:
+            if self._daily_stats:  # sort on decreasing date
+                self._daily_stats.sort(reverse=True, key=_DATE_KEY)
+            self._daily_stats_sorted = True
         return self._daily_stats
 
     @daily_stats.setter
     def daily_stats(self, value):
-        result = value
-        if result is not None and len(result) > 0:  # sort on decreasing date
-            _LOGGER.debug(f"before daily_stats: {result}")
-            result.sort(reverse=True, key=lambda k: k.date)
-            _LOGGER.debug(f"after  daily_stats: {result}")
-        self._daily_stats = result
+        self._daily_stats = value
+        self._daily_stats_sorted = False
 
     # feature only available for some regions (getter/setter for sorting)
     _month_trip_info: MonthTripInfo = None
+    _month_trip_info_sorted: bool = field(default=False, init=False, repr=False)
 
     @property
     def month_trip_info(self):
+        if not self._month_trip_info_sorted:
+            result = self._month_trip_info
+            if result is not None and result.day_list:  # sort on increasing yyyymmdd
+                _LOGGER.debug("before month_trip_info: %s", result)
+                result.day_list.sort(key=_YYYYMMDD_KEY)
+                _LOGGER.debug("after  month_trip_info: %s", result)
+            self._month_trip_info_sorted = True
         return self._month_trip_info
 
     @month_trip_info.setter
     def month_trip_info(self, value):
-        result = value
-        if (
-            result is not None
-            and hasattr(result, "day_list")
-            and len(result.day_list) > 0
-        ):  # sort on increasing yyyymmdd
-            _LOGGER.debug(f"before month_trip_info: {result}")
-            result.day_list.sort(key=lambda k: k.yyyymmdd)
-            _LOGGER.debug(f"after  month_trip_info: {result}")
-        self._month_trip_info = result
+        self._month_trip_info = value
+        self._month_trip_info_sorted = False
 
     # feature only available for some regions (getter/setter for sorting)
     _day_trip_info: DayTripInfo = None
+    _day_trip_info_sorted: bool = field(default=False, init=False, repr=False)
 
     @property
     def day_trip_info(self):
+        if not self._day_trip_info_sorted:
+            result = self._day_trip_info
+            if result is not None and result.trip_list:  # sort on descending hhmmss
+                _LOGGER.debug("before day_trip_info: %s", result)
+                result.trip_list.sort(reverse=True, key=_HHMMSS_KEY)
+                _LOGGER.debug("after day_trip_info: %s", result)
+            self._day_trip_info_sorted = True
         return self._day_trip_info
 
     @day_trip_info.setter
     def day_trip_info(self, value):
-        result = value
-        if (
-            result is not None
-            and hasattr(result, "trip_list")
-            and len(result.trip_list) > 0
-        ):  # sort on descending hhmmss
-            _LOGGER.debug(f"before day_trip_info: {result}")
-            result.trip_list.sort(reverse=True, key=lambda k: k.hhmmss)
-            _LOGGER.debug(f"after day_trip_info: {result}")
-        self._day_trip_info = result
+        self._day_trip_info = value
+        self._day_trip_info_sorted = False
 
     ev_battery_percentage: int = None
     ev_battery_soh_percentage: int = None
@@ -286,65 +326,55 @@ class Vehicle:
     ev_battery_is_plugged_in: bool = None
 
     _ev_driving_range: float = None
-    _ev_driving_range_value: float = None
     _ev_driving_range_unit: str = None
 
     _ev_estimated_current_charge_duration: int = None
-    _ev_estimated_current_charge_duration_value: int = None
     _ev_estimated_current_charge_duration_unit: str = None
 
     _ev_estimated_fast_charge_duration: int = None
-    _ev_estimated_fast_charge_duration_value: int = None
     _ev_estimated_fast_charge_duration_unit: str = None
 
     _ev_estimated_portable_charge_duration: int = None
-    _ev_estimated_portable_charge_duration_value: int = None
     _ev_estimated_portable_charge_duration_unit: str = None
 
     _ev_estimated_station_charge_duration: int = None
-    _ev_estimated_station_charge_duration_value: int = None
     _ev_estimated_station_charge_duration_unit: str = None
 
-    _ev_target_range_charge_AC: typing.Union[float, None] = None
-    _ev_target_range_charge_AC_value: typing.Union[float, None] = None
-    _ev_target_range_charge_AC_unit: typing.Union[str, None] = None
+    _ev_target_range_charge_AC: float | None = None
+    _ev_target_range_charge_AC_unit: str | None = None
 
-    _ev_target_range_charge_DC: typing.Union[float, None] = None
-    _ev_target_range_charge_DC_value: typing.Union[float, None] = None
-    _ev_target_range_charge_DC_unit: typing.Union[str, None] = None
+    _ev_target_range_charge_DC: float | None = None
+    _ev_target_range_charge_DC_unit: str | None = None
 
-    ev_first_departure_enabled: typing.Union[bool, None] = None
-    ev_second_departure_enabled: typing.Union[bool, None] = None
+    ev_first_departure_enabled: bool | None = None
+    ev_second_departure_enabled: bool | None = None
 
-    ev_first_departure_days: typing.Union[list, None] = None
-    ev_second_departure_days: typing.Union[list, None] = None
+    ev_first_departure_days: list | None = None
+    ev_second_departure_days: list | None = None
 
-    ev_first_departure_time: typing.Union[datetime.time, None] = None
-    ev_second_departure_time: typing.Union[datetime.time, None] = None
+    ev_first_departure_time: datetime.time | None = None
+    ev_second_departure_time: datetime.time | None = None
 
-    ev_first_departure_climate_enabled: typing.Union[bool, None] = None
-    ev_second_departure_climate_enabled: typing.Union[bool, None] = None
+    ev_first_departure_climate_enabled: bool | None = None
+    ev_second_departure_climate_enabled: bool | None = None
 
-    _ev_first_departure_climate_temperature: typing.Union[float, None] = None
-    _ev_first_departure_climate_temperature_value: typing.Union[float, None] = None
-    _ev_first_departure_climate_temperature_unit: typing.Union[str, None] = None
+    _ev_first_departure_climate_temperature: float | None = None
+    _ev_first_departure_climate_temperature_unit: str | None = None
 
-    _ev_second_departure_climate_temperature: typing.Union[float, None] = None
-    _ev_second_departure_climate_temperature_value: typing.Union[float, None] = None
-    _ev_second_departure_climate_temperature_unit: typing.Union[str, None] = None
+    _ev_second_departure_climate_temperature: float | None = None
+    _ev_second_departure_climate_temperature_unit: str | None = None
 
-    ev_first_departure_climate_defrost: typing.Union[bool, None] = None
-    ev_second_departure_climate_defrost: typing.Union[bool, None] = None
+    ev_first_departure_climate_defrost: bool | None = None
+    ev_second_departure_climate_defrost: bool | None = None
 
-    ev_off_peak_start_time: typing.Union[datetime.time, None] = None
-    ev_off_peak_end_time: typing.Union[datetime.time, None] = None
-    ev_off_peak_charge_only_enabled: typing.Union[bool, None] = None
+    ev_off_peak_start_time: datetime.time | None = None
+    ev_off_peak_end_time: datetime.time | None = None
+    ev_off_peak_charge_only_enabled: bool | None = None
 
-    ev_schedule_charge_enabled: typing.Union[bool, None] = None
+    ev_schedule_charge_enabled: bool | None = None
 
     # IC fields (PHEV/HEV/IC)
     _fuel_driving_range: float = None
-    _fuel_driving_range_value: float = None
     _fuel_driving_range_unit: str = None
     fuel_level: float = None
 
@@ -369,39 +399,14 @@ class Vehicle:
             self._geocode_name = None
             self._geocode_address = None
 
-    @property
-    def total_driving_range(self):
-        return self._total_driving_range
+    total_driving_range = _ValueUnit()
 
     @property
     def total_driving_range_unit(self):
         return self._total_driving_range_unit
 
-    @total_driving_range.setter
-    def total_driving_range(self, value):
-        self._total_driving_range_value = value[0]
-        self._total_driving_range_unit = value[1]
-        self._total_driving_range = value[0]
-
-    @property
-    def next_service_distance(self):
-        return self._next_service_distance
-
-    @next_service_distance.setter
-    def next_service_distance(self, value):
-        self._next_service_distance_value = value[0]
-        self._next_service_distance_unit = value[1]
-        self._next_service_distance = value[0]
-
-    @property
-    def last_service_distance(self):
-        return self._last_service_distance
-
-    @last_service_distance.setter
-    def last_service_distance(self, value):
-        self._last_service_distance_value = value[0]
-        self._last_service_distance_unit = value[1]
-        self._last_service_distance = value[0]
+    next_service_distance = _ValueUnit()
+    last_service_distance = _ValueUnit()
 
     @property
     def last_updated_at(self):
@@ -411,15 +416,19 @@ class Vehicle:
     def last_updated_at(self, value):
         # workaround for: Timestamp of "last_updated_at" sensor is wrong #931
         # https://github.com/Hyundai-Kia-Connect/kia_uvo/issues/931#issuecomment-2381569934
+        # value must be hashable (datetime or None), the conversion is cached
         newest_updated_at = get_safe_local_datetime(value)
-        previous_updated_at = self._last_updated_at
-        if newest_updated_at and previous_updated_at:  # both filled
-            if newest_updated_at < previous_updated_at:
+        if newest_updated_at is not None:
+            previous_updated_at = self._last_updated_at
+            if (
+                previous_updated_at is not None
+                and newest_updated_at < previous_updated_at
+            ):
                 utcoffset = newest_updated_at.utcoffset()
-                newest_updated_at_corrected = newest_updated_at + utcoffset
-                if newest_updated_at_corrected >= previous_updated_at:
-                    newest_updated_at = newest_updated_at_corrected
-                if newest_updated_at < previous_updated_at:
+                corrected = newest_updated_at + utcoffset if utcoffset else None
+                if corrected is not None and corrected >= previous_updated_at:
+                    newest_updated_at = corrected
+                else:
                     newest_updated_at = previous_updated_at  # keep old because newer
         self._last_updated_at = newest_updated_at
 
@@ -446,25 +455,21 @@ class Vehicle:
 
     @location.setter
     def location(self, value):
-        self._location_latitude = value[0]
-        self._location_longitude = value[1]
-        self._location_last_set_time = get_safe_local_datetime(value[2])
+        self.set_location(value[0], value[1], value[2])
 
-    @property
-    def odometer(self):
-        return self._odometer
+    def set_location(self, lat, long, time):
+        """set location without packing the values in a tuple"""
+        self._location_latitude = lat
+        self._location_longitude = long
+        # time must be hashable (datetime or None), the conversion is cached
+        self._location_last_set_time = get_safe_local_datetime(time)
+
+    odometer = _ValueUnit(get_float)
 
     @property
     def odometer_unit(self):
         return self._odometer_unit
 
-    @odometer.setter
-    def odometer(self, value):
-        float_value = get_float(value[0])
-        self._odometer_value = float_value
-        self._odometer_unit = value[1]
-        self._odometer = float_value
-
     @property
     def air_temperature(self):
         return self._air_temperature
@@ -475,122 +480,38 @@ class Vehicle:
         self._air_temperature_unit = value[1]
         self._air_temperature = value[0] if value[0] != "OFF" else None
 
-    @property
-    def ev_driving_range(self):
-        return self._ev_driving_range
+    ev_driving_range = _ValueUnit()
 
     @property
     def ev_driving_range_unit(self):
         return self._ev_driving_range_unit
 
-    @ev_driving_range.setter
-    def ev_driving_range(self, value):
-        self._ev_driving_range_value = value[0]
-        self._ev_driving_range_unit = value[1]
-        self._ev_driving_range = value[0]
-
-    @property
-    def ev_estimated_current_charge_duration(self):
-        return self._ev_estimated_current_charge_duration
-
-    @ev_estimated_current_charge_duration.setter
-    def ev_estimated_current_charge_duration(self, value):
-        self._ev_estimated_current_charge_duration_value = value[0]
-        self._ev_estimated_current_charge_duration_unit = value[1]
-        self._ev_estimated_current_charge_duration = value[0]
-
-    @property
-    def ev_estimated_fast_charge_duration(self):
-        return self._ev_estimated_fast_charge_duration
-
-    @ev_estimated_fast_charge_duration.setter
-    def ev_estimated_fast_charge_duration(self, value):
-        self._ev_estimated_fast_charge_duration_value = value[0]
-        self._ev_estimated_fast_charge_duration_unit = value[1]
-        self._ev_estimated_fast_charge_duration = value[0]
-
-    @property
-    def ev_estimated_portable_charge_duration(self):
-        return self._ev_estimated_portable_charge_duration
-
-    @ev_estimated_portable_charge_duration.setter
-    def ev_estimated_portable_charge_duration(self, value):
-        self._ev_estimated_portable_charge_duration_value = value[0]
-        self._ev_estimated_portable_charge_duration_unit = value[1]
-        self._ev_estimated_portable_charge_duration = value[0]
-
-    @property
-    def ev_estimated_station_charge_duration(self):
-        return self._ev_estimated_station_charge_duration
-
-    @ev_estimated_station_charge_duration.setter
-    def ev_estimated_station_charge_duration(self, value):
-        self._ev_estimated_station_charge_duration_value = value[0]
-        self._ev_estimated_station_charge_duration_unit = value[1]
-        self._ev_estimated_station_charge_duration = value[0]
-
-    @property
-    def ev_target_range_charge_AC(self):
-        return self._ev_target_range_charge_AC
+    ev_estimated_current_charge_duration = _ValueUnit()
+    ev_estimated_fast_charge_duration = _ValueUnit()
+    ev_estimated_portable_charge_duration = _ValueUnit()
+    ev_estimated_station_charge_duration = _ValueUnit()
+    ev_target_range_charge_AC = _ValueUnit()
 
     @property
     def ev_target_range_charge_AC_unit(self):
         return self._ev_target_range_charge_AC_unit
 
-    @ev_target_range_charge_AC.setter
-    def ev_target_range_charge_AC(self, value):
-        self._ev_target_range_charge_AC_value = value[0]
-        self._ev_target_range_charge_AC_unit = value[1]
-        self._ev_target_range_charge_AC = value[0]
-
-    @property
-    def ev_target_range_charge_DC(self):
-        return self._ev_target_range_charge_DC
+    ev_target_range_charge_DC = _ValueUnit()
 
     @property
     def ev_target_range_charge_DC_unit(self):
         return self._ev_target_range_charge_DC_unit
 
-    @ev_target_range_charge_DC.setter
-    def ev_target_range_charge_DC(self, value):
-        self._ev_target_range_charge_DC_value = value[0]
-        self._ev_target_range_charge_DC_unit = value[1]
-        self._ev_target_range_charge_DC = value[0]
-
-    @property
-    def ev_first_departure_climate_temperature(self):
-        return self._ev_first_departure_climate_temperature
+    ev_first_departure_climate_temperature = _ValueUnit()
 
     @property
     def ev_first_departure_climate_temperature_unit(self):
         return self._ev_first_departure_climate_temperature_unit
 
-    @ev_first_departure_climate_temperature.setter
-    def ev_first_departure_climate_temperature(self, value):
-        self._ev_first_departure_climate_temperature_value = value[0]
-        self._ev_first_departure_climate_temperature_unit = value[1]
-        self._ev_first_departure_climate_temperature = value[0]
-
-    @property
-    def ev_second_departure_climate_temperature(self):
-        return self._ev_second_departure_climate_temperature
+    ev_second_departure_climate_temperature = _ValueUnit()
 
     @property
     def ev_second_departure_climate_temperature_unit(self):
         return self._ev_second_departure_climate_temperature_unit
 
-    @ev_second_departure_climate_temperature.setter
-    def ev_second_departure_climate_temperature(self, value):
-        self._ev_second_departure_climate_temperature_value = value[0]
-        self._ev_second_departure_climate_temperature_unit = value[1]
-        self._ev_second_departure_climate_temperature = value[0]
-
-    @property
-    def fuel_driving_range(self):
-        return self._fuel_driving_range
-
-    @fuel_driving_range.setter
-    def fuel_driving_range(self, value):
-        self._fuel_driving_range_value = value[0]
-        self._fuel_driving_range_unit = value[1]
-        self._fuel_driving_range = value[0]
+    fuel_driving_range = _ValueUnit()
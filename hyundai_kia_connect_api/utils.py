@@ -2,7 +2,9 @@
 """utils.py"""
 
 import datetime
+import functools
 import re
+import time
 
 
 def get_child_value(data, key):
@@ -71,6 +73,14 @@ def parse_datetime(value, timezone) -> datetime.datetime:
 
 def get_safe_local_datetime(date: datetime) -> datetime:
     """get safe local datetime"""
+    # the local timezone can change at runtime (time.tzset), so it is part of
+    # the cache key: a repeated timestamp would otherwise stay cached forever
+    return _get_safe_local_datetime(date, time.tzname, time.timezone, time.altzone)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_safe_local_datetime(date, tzname, timezone, altzone):
+    """cached as polls often repeat the same timestamp"""
     if date is not None and hasattr(date, "tzinfo") and date.tzinfo is not None:
         date = date.astimezone()
     return date
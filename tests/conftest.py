@@ -1,3 +1,6 @@
+import time
+
+import pytest
 from dotenv import load_dotenv
 
 
@@ -6,3 +9,16 @@ load_dotenv()
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "br: mark test for the Brazilian API")
+
+
+@pytest.fixture
+def set_local_timezone(monkeypatch):
+    """Switch the process local timezone (TZ) for the duration of a test."""
+
+    def _set(tz):
+        monkeypatch.setenv("TZ", tz)
+        time.tzset()
+
+    yield _set
+    monkeypatch.undo()
+    time.tzset()
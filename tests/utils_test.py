@@ -0,0 +1,17 @@
+import datetime
+
+from hyundai_kia_connect_api.utils import get_safe_local_datetime
+
+
+def test_get_safe_local_datetime_follows_timezone_change(set_local_timezone):
+    value = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    set_local_timezone("UTC0")
+    assert get_safe_local_datetime(value).utcoffset() == datetime.timedelta(0)
+    set_local_timezone("CET-1")
+    assert get_safe_local_datetime(value).utcoffset() == datetime.timedelta(hours=1)
+
+
+def test_get_safe_local_datetime_keeps_naive_and_none():
+    value = datetime.datetime(2024, 1, 1, 12, 0)
+    assert get_safe_local_datetime(value) is value
+    assert get_safe_local_datetime(None) is None
@@ -0,0 +1,182 @@
+import dataclasses
+import datetime
+import pytest
+
+from hyundai_kia_connect_api.Vehicle import (
+    Vehicle,
+    DailyDrivingStats,
+    DayTripCounts,
+    DayTripInfo,
+    MonthTripInfo,
+    TripDayListItem,
+    TripInfo,
+    VehicleLocation,
+)
+
+
+def test_vehicle_has_no_instance_dict():
+    vehicle = Vehicle()
+    assert not hasattr(vehicle, "__dict__")
+    assert not hasattr(DailyDrivingStats(), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        VehicleLocation(lat=50.0, long=4.0),
+        TripDayListItem(date=datetime.datetime(2024, 1, 1), count=2),
+        DayTripCounts(yyyymmdd="20240101", trip_count=2),
+    ],
+)
+def test_list_item_types_are_slotted(instance):
+    assert not hasattr(instance, "__dict__")
+    assert not hasattr(instance, "__weakref__")
+
+
+def test_vehicle_rejects_unknown_attribute():
+    vehicle = Vehicle()
+    with pytest.raises(AttributeError):
+        vehicle.unknown_attribute = True
+
+
+def test_vehicle_seat_heater_fields():
+    vehicle = Vehicle()
+    assert vehicle.front_left_seat_heater_is_on is None
+    vehicle.front_left_seat_heater_is_on = 2
+    assert vehicle.front_left_seat_heater_is_on == 2
+
+
+def test_value_unit_setters():
+    vehicle = Vehicle()
+    vehicle.total_driving_range = (350, "km")
+    vehicle.odometer = ("1234.5", "km")
+    assert vehicle.total_driving_range == 350
+    assert vehicle.total_driving_range_unit == "km"
+    assert vehicle.odometer == 1234.5
+    assert vehicle.odometer_unit == "km"
+    assert vehicle.ev_driving_range is None
+
+
+def test_last_updated_at_keeps_newest():
+    newer = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    older = datetime.datetime(2023, 12, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    vehicle = Vehicle()
+    vehicle.last_updated_at = newer
+    vehicle.last_updated_at = older
+    assert vehicle.last_updated_at == newer
+    vehicle.last_updated_at = None
+    assert vehicle.last_updated_at is None
+
+
+def test_last_updated_at_corrects_offset(set_local_timezone):
+    set_local_timezone("CET-1")
+    tz = datetime.timezone(datetime.timedelta(hours=1))
+    vehicle = Vehicle()
+    vehicle.last_updated_at = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=tz)
+    # older by less than the utc offset: reported as UTC, corrected by the offset
+    vehicle.last_updated_at = datetime.datetime(2024, 1, 1, 11, 30, tzinfo=tz)
+    assert vehicle.last_updated_at == datetime.datetime(2024, 1, 1, 12, 30, tzinfo=tz)
+    # older by more than the utc offset: the previous value is kept
+    vehicle.last_updated_at = datetime.datetime(2024, 1, 1, 10, 0, tzinfo=tz)
+    assert vehicle.last_updated_at == datetime.datetime(2024, 1, 1, 12, 30, tzinfo=tz)
+
+
+def test_last_updated_at_keeps_newest_naive():
+    newer = datetime.datetime(2024, 1, 1, 12, 0)
+    vehicle = Vehicle()
+    vehicle.last_updated_at = newer
+    vehicle.last_updated_at = datetime.datetime(2024, 1, 1, 11, 0)
+    assert vehicle.last_updated_at == newer
+
+
+def test_daily_stats_sorted_on_decreasing_date():
+    days = [
+        DailyDrivingStats(date=datetime.datetime(2024, 1, day)) for day in (2, 1, 3)
+    ]
+    vehicle = Vehicle()
+    vehicle.daily_stats = days
+    assert [stats.date.day for stats in vehicle.daily_stats] == [3, 2, 1]
+    vehicle.daily_stats = vehicle.daily_stats + [
+        DailyDrivingStats(date=datetime.datetime(2024, 1, 4))
+    ]
+    assert [stats.date.day for stats in vehicle.daily_stats] == [4, 3, 2, 1]
+    vehicle.daily_stats = None
+    assert vehicle.daily_stats is None
+
+
+def test_daily_stats_resorted_after_in_place_change():
+    vehicle = Vehicle()
+    vehicle.daily_stats = [
+        DailyDrivingStats(date=datetime.datetime(2024, 1, day)) for day in (1, 3)
+    ]
+    assert [stats.date.day for stats in vehicle.daily_stats] == [3, 1]
+    vehicle.daily_stats.append(DailyDrivingStats(date=datetime.datetime(2024, 1, 5)))
+    vehicle.daily_stats = vehicle.daily_stats
+    assert [stats.date.day for stats in vehicle.daily_stats] == [5, 3, 1]
+
+
+def test_vehicle_compares_by_identity():
+    vehicle = Vehicle(id="1")
+    assert vehicle == vehicle
+    assert vehicle != Vehicle(id="1")
+
+
+def test_trip_info_sorted_on_read():
+    vehicle = Vehicle()
+    vehicle.month_trip_info = MonthTripInfo(
+        yyyymm="202401",
+        day_list=[
+            DayTripCounts(yyyymmdd="20240103", trip_count=1),
+            DayTripCounts(yyyymmdd="20240101", trip_count=2),
+        ],
+    )
+    vehicle.day_trip_info = DayTripInfo(
+        yyyymmdd="20240101",
+        trip_list=[TripInfo(hhmmss="080000"), TripInfo(hhmmss="170000")],
+    )
+    assert [day.yyyymmdd for day in vehicle.month_trip_info.day_list] == [
+        "20240101",
+        "20240103",
+    ]
+    assert [trip.hhmmss for trip in vehicle.day_trip_info.trip_list] == [
+        "170000",
+        "080000",
+    ]
+    vehicle.month_trip_info = None
+    assert vehicle.month_trip_info is None
+
+
+def test_set_location():
+    vehicle = Vehicle()
+    vehicle.set_location(50.85, 4.35, None)
+    assert vehicle.location_latitude == 50.85
+    assert vehicle.location_longitude == 4.35
+    assert vehicle.location_last_updated_at is None
+    vehicle.location = (51.0, 5.0, None)
+    assert vehicle.location == (5.0, 51.0)
+
+
+def test_flags_are_dataclass_fields():
+    vehicle = Vehicle(is_locked=True, hood_is_open=False)
+    assert vehicle.is_locked is True
+    assert "is_locked=True" in repr(vehicle)
+    copy = dataclasses.replace(vehicle)
+    assert copy.is_locked is True
+    assert copy.hood_is_open is False
+    assert copy.fuel_level_is_low is None
+
+
+def test_flags_keep_raw_api_values():
+    vehicle = Vehicle()
+    vehicle.ev_battery_is_plugged_in = 2  # AC
+    assert vehicle.ev_battery_is_plugged_in == 2
+
+
+def test_vehicle_asdict():
+    vehicle = Vehicle()
+    assert vehicle._air_temperature_value is None
+    as_dict = dataclasses.asdict(vehicle)
+    assert as_dict["_air_temperature_value"] is None
+    vehicle.air_temperature = ("OFF", "°C")
+    assert vehicle.air_temperature is None
+    assert dataclasses.asdict(vehicle)["_air_temperature_value"] == "OFF"